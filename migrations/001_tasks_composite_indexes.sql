@@ -0,0 +1,8 @@
+-- Índices compostos de tasks para bancos criados antes deles existirem no modelo.
+-- Bancos novos já recebem esses índices via `python main.py` (create_all).
+CREATE INDEX ix_tasks_user_created ON tasks (user_id, created_at);
+CREATE INDEX ix_tasks_user_updated ON tasks (user_id, updated_at);
+CREATE INDEX ix_tasks_user_status ON tasks (user_id, status);
+
+-- Índice redundante com a chave primária, criado pelo modelo antigo (index=True em id)
+DROP INDEX ix_tasks_id ON tasks;
@@ -0,0 +1,3 @@
+-- Índice FULLTEXT usado por GET /tasks/?search_mode=words, para bancos criados antes dele.
+-- Sem ele, a busca por palavras falha com o erro 1191 do MySQL.
+CREATE FULLTEXT INDEX ft_tasks_title_desc ON tasks (title, description);